@@ -3,6 +3,8 @@
 from pathlib import Path
 from typing import List
 from functools import lru_cache
+from limits import parse_many
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Find the project root directory (where run.py is located)
@@ -51,17 +53,26 @@ class Settings(BaseSettings):
     # Cache Configuration
     cache_max_size: int = 1000
     cache_ttl_seconds: int = 3600  # 1 hour default TTL
+    cache_stale_grace_seconds: int = 600  # Serve stale recipes this long while refreshing
+    cache_disk_path: str = str(PROJECT_ROOT / ".cache" / "recipes.sqlite3")  # Empty disables
 
     # Security Configuration
     enable_security_headers: bool = True
 
+    @field_validator("rate_limit_recipe", "rate_limit_health", "rate_limit_cache")
+    @classmethod
+    def validate_rate_limit(cls, v: str) -> str:
+        """Reject rate limit strings that slowapi would silently skip."""
+        parse_many(v)
+        return v
+
     @property
     def is_gemini_configured(self) -> bool:
         """Check if Gemini API key is configured."""
         return bool(self.gemini_api_key)
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
@@ -1,11 +1,19 @@
 """Core application functionality."""
 
-from .security import configure_cors, configure_security_headers
+from .compression import configure_compression
+from .security import configure_cors, configure_etag, configure_security_headers
 from .exceptions import APIError, configure_exception_handlers
+from .micro_cache import configure_micro_cache
+from .rate_limit import configure_rate_limiting, rate_limit
 
 __all__ = [
+    "configure_compression",
     "configure_cors",
+    "configure_etag",
     "configure_security_headers",
     "APIError",
     "configure_exception_handlers",
+    "configure_micro_cache",
+    "configure_rate_limiting",
+    "rate_limit",
 ]
@@ -0,0 +1,139 @@
+"""Response compression middleware with Brotli, zstd and gzip support."""
+
+import gzip
+import logging
+from typing import Callable, Dict, Optional, Set
+
+import brotli
+import zstandard
+from fastapi import FastAPI
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+_zstd_compressor = zstandard.ZstdCompressor(level=3)
+
+# Supported encodings in order of preference
+_ENCODERS: Dict[str, Callable[[bytes], bytes]] = {
+    "br": lambda body: brotli.compress(body, quality=4),
+    "zstd": _zstd_compressor.compress,
+    "gzip": lambda body: gzip.compress(body, compresslevel=6, mtime=0),
+}
+
+
+def _accepted_encodings(accept_encoding: str) -> Set[str]:
+    """Parse an Accept-Encoding header into the set of acceptable encodings."""
+    accepted = set()
+    for item in accept_encoding.lower().split(","):
+        token, _, params = item.partition(";")
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(token.strip())
+    return accepted
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """
+    Derive the ETag of an encoded representation from the identity ETag.
+
+    Strong ETags must differ between byte-different representations, so the
+    encoding is appended inside the quotes (``"abc"`` -> ``"abc-br"``), the
+    same form the cache uses for stored gzip bodies. Weak ETags are kept.
+    """
+    if etag.startswith("W/") or not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def identity_etag(etag: str) -> str:
+    """Strip an encoding suffix added by :func:`encoded_etag`."""
+    for encoding in _ENCODERS:
+        suffix = f'-{encoding}"'
+        if etag.endswith(suffix):
+            return etag[: -len(suffix)] + '"'
+    return etag
+
+
+def accepts_encoding(accept_encoding: str, encoding: str) -> bool:
+    """Check whether an Accept-Encoding header allows ``encoding``."""
+    return encoding in _accepted_encodings(accept_encoding)
+
+
+def select_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the preferred supported encoding from an Accept-Encoding header."""
+    accepted = _accepted_encodings(accept_encoding)
+    for encoding in _ENCODERS:
+        if encoding in accepted:
+            return encoding
+    return None
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing buffered responses with br, zstd or gzip.
+
+    Streaming responses (those sent in several body chunks) and responses
+    that already carry a Content-Encoding are passed through untouched.
+    A strong ETag on a compressed response gets an encoding suffix.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1000):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(scope=start_message)
+            if (
+                message.get("more_body", False)
+                or "content-encoding" in headers
+                or len(body) < self.minimum_size
+            ):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            body = _ENCODERS[encoding](body)
+            headers["Content-Encoding"] = encoding
+            if "etag" in headers:
+                headers["ETag"] = encoded_etag(headers["etag"], encoding)
+            headers["Content-Length"] = str(len(body))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def configure_compression(app: FastAPI, minimum_size: int = 1000) -> None:
+    """Configure response compression middleware."""
+    app.add_middleware(CompressionMiddleware, minimum_size=minimum_size)
+    logger.info(f"Compression enabled ({', '.join(_ENCODERS)}), minimum size {minimum_size}")
@@ -3,15 +3,25 @@
 import logging
 from typing import Optional
 
-from fastapi import FastAPI, Request
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from app.models.schemas import ErrorResponse
-
 logger = logging.getLogger(__name__)
 
+# Machine-readable codes for standard HTTP exceptions
+_HTTP_ERROR_CODES = {
+    400: "BAD_REQUEST",
+    401: "UNAUTHORIZED",
+    403: "FORBIDDEN",
+    404: "NOT_FOUND",
+    405: "METHOD_NOT_ALLOWED",
+    429: "RATE_LIMIT_EXCEEDED",
+    500: "INTERNAL_ERROR",
+    503: "SERVICE_UNAVAILABLE",
+}
+
 
 class APIError(Exception):
     """Custom API error with structured response."""
@@ -62,59 +72,49 @@ class InternalServerError(APIError):
         super().__init__(500, message, "INTERNAL_ERROR", details)
 
 
+def _error_response(
+    status_code: int, message: str, error_code: str, details: Optional[dict] = None
+) -> Response:
+    """Serialize an error body (shaped like ErrorResponse) straight to JSON bytes."""
+    return Response(
+        content=orjson.dumps(
+            {"message": message, "error_code": error_code, "details": details}
+        ),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
 def configure_exception_handlers(app: FastAPI) -> None:
     """Configure global exception handlers for the application."""
 
     @app.exception_handler(APIError)
-    async def api_error_handler(request: Request, exc: APIError) -> JSONResponse:
+    async def api_error_handler(request: Request, exc: APIError) -> Response:
         """Handle custom API errors."""
         logger.warning(
             f"API Error: {exc.error_code} - {exc.message}",
             extra={"path": request.url.path, "details": exc.details},
         )
-        return JSONResponse(
-            status_code=exc.status_code,
-            content=ErrorResponse(
-                message=exc.message,
-                error_code=exc.error_code,
-                details=exc.details,
-            ).model_dump(),
-        )
+        return _error_response(exc.status_code, exc.message, exc.error_code, exc.details)
 
     @app.exception_handler(StarletteHTTPException)
     async def http_exception_handler(
         request: Request, exc: StarletteHTTPException
-    ) -> JSONResponse:
+    ) -> Response:
         """Handle standard HTTP exceptions."""
-        error_codes = {
-            400: "BAD_REQUEST",
-            401: "UNAUTHORIZED",
-            403: "FORBIDDEN",
-            404: "NOT_FOUND",
-            405: "METHOD_NOT_ALLOWED",
-            429: "RATE_LIMIT_EXCEEDED",
-            500: "INTERNAL_ERROR",
-            503: "SERVICE_UNAVAILABLE",
-        }
-        error_code = error_codes.get(exc.status_code, "HTTP_ERROR")
+        error_code = _HTTP_ERROR_CODES.get(exc.status_code, "HTTP_ERROR")
 
         logger.warning(
             f"HTTP Exception: {exc.status_code} - {exc.detail}",
             extra={"path": request.url.path},
         )
 
-        return JSONResponse(
-            status_code=exc.status_code,
-            content=ErrorResponse(
-                message=str(exc.detail),
-                error_code=error_code,
-            ).model_dump(),
-        )
+        return _error_response(exc.status_code, str(exc.detail), error_code)
 
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(
         request: Request, exc: RequestValidationError
-    ) -> JSONResponse:
+    ) -> Response:
         """Handle request validation errors."""
         errors = []
         for error in exc.errors():
@@ -126,17 +126,12 @@ def configure_exception_handlers(app: FastAPI) -> None:
             extra={"path": request.url.path},
         )
 
-        return JSONResponse(
-            status_code=422,
-            content=ErrorResponse(
-                message="Request validation failed",
-                error_code="VALIDATION_ERROR",
-                details={"errors": errors},
-            ).model_dump(),
+        return _error_response(
+            422, "Request validation failed", "VALIDATION_ERROR", {"errors": errors}
         )
 
     @app.exception_handler(Exception)
-    async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    async def global_exception_handler(request: Request, exc: Exception) -> Response:
         """Handle all unhandled exceptions."""
         # Log the full exception for debugging
         logger.error(
@@ -146,10 +141,4 @@ def configure_exception_handlers(app: FastAPI) -> None:
         )
 
         # Return a generic error response (don't leak internal details)
-        return JSONResponse(
-            status_code=500,
-            content=ErrorResponse(
-                message="An unexpected error occurred",
-                error_code="INTERNAL_ERROR",
-            ).model_dump(),
-        )
+        return _error_response(500, "An unexpected error occurred", "INTERNAL_ERROR")
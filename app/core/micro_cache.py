@@ -0,0 +1,75 @@
+"""Short-lived response cache for frequently polled endpoints."""
+
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# (expires_at, status, headers, body)
+_CachedResponse = Tuple[float, int, List[Tuple[bytes, bytes]], bytes]
+
+
+class MicroCacheMiddleware:
+    """
+    ASGI middleware caching whole GET responses for a second or two.
+
+    Health probes and dashboards poll a few near-constant endpoints; bursts
+    within the TTL are answered from memory without reaching the route.
+    Only complete (non-streaming) 200 responses are cached.
+    """
+
+    def __init__(self, app: ASGIApp, ttls: Dict[str, float], max_entries: int = 256):
+        self.app = app
+        self.ttls = ttls
+        self.max_entries = max_entries
+        self._store: Dict[str, _CachedResponse] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        ttl = self.ttls.get(scope["path"]) if scope["type"] == "http" else None
+        if ttl is None or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        key = f"{scope['path']}?{scope['query_string'].decode('latin-1')}"
+        cached = self._store.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            _, status, headers, body = cached
+            await send({"type": "http.response.start", "status": status, "headers": list(headers)})
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        status: Optional[int] = None
+        headers: List[Tuple[bytes, bytes]] = []
+        first_body = True
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, headers, first_body
+            if message["type"] == "http.response.start":
+                # Snapshot before outer middleware can mutate the header list
+                status = message["status"]
+                headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                if first_body and status == 200 and not message.get("more_body", False):
+                    self._remember(key, ttl, status, headers, message.get("body", b""))
+                first_body = False
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _remember(
+        self, key: str, ttl: float, status: int, headers: List[Tuple[bytes, bytes]], body: bytes
+    ) -> None:
+        """Store a response, dropping everything if the store grows too large."""
+        if len(self._store) >= self.max_entries and key not in self._store:
+            self._store.clear()
+        self._store[key] = (time.monotonic() + ttl, status, headers, body)
+
+
+def configure_micro_cache(app: FastAPI, ttls: Dict[str, float]) -> None:
+    """Configure the micro-cache middleware for the given path TTLs."""
+    app.add_middleware(MicroCacheMiddleware, ttls=ttls)
+    logger.info(f"Micro-cache enabled for: {ttls}")
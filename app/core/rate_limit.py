@@ -0,0 +1,51 @@
+"""Per-app rate limiter shared by all of that app's routers."""
+
+import functools
+import logging
+from typing import Any, Awaitable, Callable
+
+from fastapi import FastAPI
+from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
+from slowapi.util import get_remote_address
+
+logger = logging.getLogger(__name__)
+
+Endpoint = Callable[..., Awaitable[Any]]
+
+
+def rate_limit(setting: str) -> Callable[[Endpoint], Endpoint]:
+    """
+    Rate limit an endpoint by the ``setting`` limit of the app serving it.
+
+    Route modules are imported before any app exists, so the endpoint is
+    bound to the app's limiter on its first request there: the limit
+    string is read from that app's settings and parsed once, then reused.
+    A callable ``limiter.limit`` provider would be re-parsed per request.
+
+    Args:
+        setting: Name of the ``Settings`` field holding the limit string.
+    """
+    def decorator(func: Endpoint) -> Endpoint:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            state = kwargs["request"].app.state
+            limited = state.rate_limited_endpoints.get(wrapper)
+            if limited is None:
+                limit_value = getattr(state.settings, setting)
+                limited = state.limiter.limit(limit_value)(func)
+                state.rate_limited_endpoints[wrapper] = limited
+            return await limited(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def configure_rate_limiting(app: FastAPI) -> None:
+    """Attach a limiter and its exception handler to the app."""
+    # One limiter per app so every router of the app shares one storage backend
+    app.state.limiter = Limiter(key_func=get_remote_address)
+    app.state.rate_limited_endpoints = {}
+    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+    logger.info("Rate limiting configured")
@@ -1,13 +1,16 @@
 """Security middleware and CORS configuration."""
 
+import hashlib
 import logging
-from typing import Callable
+from typing import Optional, Tuple
 
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.config import Settings
+from app.core.compression import identity_etag
 
 logger = logging.getLogger(__name__)
 
@@ -31,29 +34,51 @@ def configure_cors(app: FastAPI, settings: Settings) -> None:
     logger.info(f"CORS configured with origins: {origins}")
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Middleware to add security headers to all responses."""
+# Pre-encoded security headers added to every response
+_SECURITY_HEADERS = [
+    (b"x-content-type-options", b"nosniff"),  # Prevent MIME type sniffing
+    (b"x-frame-options", b"DENY"),  # Prevent clickjacking
+    (b"x-xss-protection", b"1; mode=block"),  # XSS protection (for older browsers)
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+]
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        response = await call_next(request)
+# API responses additionally disable caching
+_API_SECURITY_HEADERS = _SECURITY_HEADERS + [
+    (b"cache-control", b"no-store, no-cache, must-revalidate"),
+]
 
-        # Prevent MIME type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
+# Paths answered with ETags; clients may keep a copy but must revalidate it
+_ETAG_PATHS = ("/api/recipe",)
 
-        # Prevent clickjacking
-        response.headers["X-Frame-Options"] = "DENY"
+_REVALIDATED_API_SECURITY_HEADERS = _SECURITY_HEADERS + [
+    (b"cache-control", b"no-cache"),
+]
 
-        # XSS protection (for older browsers)
-        response.headers["X-XSS-Protection"] = "1; mode=block"
 
-        # Referrer policy
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+class SecurityHeadersMiddleware:
+    """ASGI middleware to add security headers to all responses."""
 
-        # Cache control for API responses
-        if request.url.path.startswith("/api/"):
-            response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate"
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["path"] in _ETAG_PATHS:
+            extra_headers = _REVALIDATED_API_SECURITY_HEADERS
+        elif scope["path"].startswith("/api/"):
+            extra_headers = _API_SECURITY_HEADERS
+        else:
+            extra_headers = _SECURITY_HEADERS
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + extra_headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
 
 
 def configure_security_headers(app: FastAPI, settings: Settings) -> None:
@@ -61,3 +86,92 @@ def configure_security_headers(app: FastAPI, settings: Settings) -> None:
     if settings.enable_security_headers:
         app.add_middleware(SecurityHeadersMiddleware)
         logger.info("Security headers middleware enabled")
+
+
+class ETagMiddleware:
+    """
+    ASGI middleware adding ETags and conditional handling for recipe lookups.
+
+    Recipe responses are deterministic for a given request, so a client that
+    already holds the body can send its ETag in If-None-Match and skip the
+    payload. GET and HEAD requests get an empty 304. Other methods get an
+    empty 412 as RFC 9110 requires; for POST clients a 412 therefore means
+    "the copy you hold is current". Routes may set their own ETag header
+    (e.g. precomputed in the cache); otherwise the body is hashed here.
+    """
+
+    def __init__(self, app: ASGIApp, paths: Tuple[str, ...] = _ETAG_PATHS):
+        self.app = app
+        self.paths = paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        safe_method = scope["method"] in ("GET", "HEAD")
+        start_message: Optional[Message] = None
+        body_parts = []
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            await self._send_with_etag(
+                start_message, b"".join(body_parts), if_none_match, safe_method, send
+            )
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    async def _send_with_etag(
+        start_message: Message,
+        body: bytes,
+        if_none_match: Optional[str],
+        safe_method: bool,
+        send: Send,
+    ) -> None:
+        """Attach the ETag and reply 304 (or 412) when the client copy is current."""
+        if start_message["status"] != 200:
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        headers = MutableHeaders(scope=start_message)
+        etag = headers.get("etag")
+        if etag is None:
+            etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+            headers["ETag"] = etag
+
+        # Compare ignoring encoding suffixes: every encoding of the body is current
+        if if_none_match and (
+            if_none_match.strip() == "*"
+            or identity_etag(etag)
+            in (identity_etag(tag.strip()) for tag in if_none_match.split(","))
+        ):
+            del headers["content-type"]
+            if safe_method:
+                del headers["content-length"]
+                start_message["status"] = 304
+            else:
+                headers["content-length"] = "0"
+                start_message["status"] = 412
+            body = b""
+
+        await send(start_message)
+        await send({"type": "http.response.body", "body": body})
+
+
+def configure_etag(app: FastAPI) -> None:
+    """Configure ETag middleware for recipe responses."""
+    app.add_middleware(ETagMiddleware)
+    logger.info("ETag middleware enabled")
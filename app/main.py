@@ -1,21 +1,23 @@
 """FastAPI application factory."""
 
 import logging
+import sqlite3
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator, Optional
 
 from fastapi import FastAPI
-from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
+from fastapi.responses import FileResponse, ORJSONResponse
 
 from app.config import Settings, get_settings
-from app.core.security import configure_cors, configure_security_headers
+from app.core.compression import configure_compression
+from app.core.security import configure_cors, configure_etag, configure_security_headers
 from app.core.exceptions import configure_exception_handlers
+from app.core.micro_cache import configure_micro_cache
+from app.core.rate_limit import configure_rate_limiting
 from app.routes import health_router, recipe_router
-from app.services.cache import InMemoryCache, CacheService
+from app.services.cache import DiskCache, InMemoryCache, CacheService
 from app.services.gemini import GeminiService
 
 # Configure logging
@@ -25,6 +27,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Frequently polled, near-constant endpoints and how long (seconds) to reuse responses
+MICRO_CACHE_TTLS = {"/health": 2.0, "/api/cache/stats": 1.0}
+
+
+def _open_disk_cache(path: str) -> Optional[DiskCache]:
+    """Open the persistent cache tier, running memory-only if it is unusable."""
+    if not path:
+        return None
+    try:
+        return DiskCache(path)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Disk cache unavailable at {path}, running without it: {e}")
+        return None
+
 
 def create_app(settings: Settings = None) -> FastAPI:
     """
@@ -39,44 +55,70 @@ def create_app(settings: Settings = None) -> FastAPI:
     if settings is None:
         settings = get_settings()
 
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        """Build services once per worker process and log lifecycle events."""
+        cache = InMemoryCache(
+            max_size=settings.cache_max_size,
+            default_ttl=settings.cache_ttl_seconds,
+        )
+        disk = _open_disk_cache(settings.cache_disk_path)
+        gemini_service = GeminiService(settings)
+
+        # Store services in app state for access in routes
+        app.state.cache_service = CacheService(
+            cache, stale_grace=settings.cache_stale_grace_seconds, disk=disk
+        )
+        app.state.gemini_service = gemini_service
+
+        logger.info(f"Starting {settings.app_name} v{settings.app_version}")
+        logger.info(f"Gemini API: {'configured' if gemini_service.is_configured else 'not configured'}")
+        logger.info(f"CORS origins: {settings.cors_origins}")
+        logger.info(f"Cache max size: {settings.cache_max_size}")
+        logger.info(f"Disk cache: {settings.cache_disk_path if disk else 'disabled'}")
+        logger.info(f"Rate limit (recipe): {settings.rate_limit_recipe}")
+
+        yield
+
+        logger.info("Shutting down application")
+        if disk is not None:
+            disk.close()
+
     # Create FastAPI app
     app = FastAPI(
         title=settings.app_name,
         description="AI-powered ingredient quantity calculator using Google Gemini",
         version=settings.app_version,
-        docs_url="/docs" if settings.debug else "/docs",
-        redoc_url="/redoc" if settings.debug else "/redoc",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
+        docs_url="/docs" if settings.debug else None,
+        redoc_url="/redoc" if settings.debug else None,
+        openapi_url="/openapi.json" if settings.debug else None,
     )
 
     # Configure rate limiting
-    limiter = Limiter(key_func=get_remote_address)
-    app.state.limiter = limiter
-    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+    configure_rate_limiting(app)
 
     # Configure middleware (order matters!)
-    # 1. GZip compression
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    # 1. ETags (innermost, so it hashes the uncompressed body)
+    configure_etag(app)
 
-    # 2. Security headers
+    # 2. Micro-cache for polled endpoints (stores uncompressed bodies)
+    configure_micro_cache(app, MICRO_CACHE_TTLS)
+
+    # 3. Compression (br, zstd or gzip, negotiated per request)
+    configure_compression(app, minimum_size=1000)
+
+    # 4. Security headers
     configure_security_headers(app, settings)
 
-    # 3. CORS
+    # 5. CORS
     configure_cors(app, settings)
 
     # Configure exception handlers
     configure_exception_handlers(app)
 
-    # Initialize services
-    cache = InMemoryCache(
-        max_size=settings.cache_max_size,
-        default_ttl=settings.cache_ttl_seconds,
-    )
-    cache_service = CacheService(cache)
-    gemini_service = GeminiService(settings)
-
-    # Store services in app state for access in routes
-    app.state.cache_service = cache_service
-    app.state.gemini_service = gemini_service
+    # Services are created per worker in lifespan; settings are needed eagerly
     app.state.settings = settings
 
     # Register routers
@@ -93,19 +135,6 @@ def create_app(settings: Settings = None) -> FastAPI:
         async def serve_frontend():
             return FileResponse(str(frontend_dir / "index.html"))
 
-    # Log startup info
-    @app.on_event("startup")
-    async def startup_event():
-        logger.info(f"Starting {settings.app_name} v{settings.app_version}")
-        logger.info(f"Gemini API: {'configured' if gemini_service.is_configured else 'not configured'}")
-        logger.info(f"CORS origins: {settings.cors_origins}")
-        logger.info(f"Cache max size: {settings.cache_max_size}")
-        logger.info(f"Rate limit (recipe): {settings.rate_limit_recipe}")
-
-    @app.on_event("shutdown")
-    async def shutdown_event():
-        logger.info("Shutting down application")
-
     return app
 
 
@@ -8,6 +8,7 @@ from .schemas import (
     CacheStatsResponse,
     ErrorResponse,
 )
+from .structs import IngredientStruct, RecipeStruct, validate_ingredient, validate_recipe
 
 __all__ = [
     "Ingredient",
@@ -16,4 +17,8 @@ __all__ = [
     "HealthResponse",
     "CacheStatsResponse",
     "ErrorResponse",
+    "IngredientStruct",
+    "RecipeStruct",
+    "validate_ingredient",
+    "validate_recipe",
 ]
@@ -1,9 +1,12 @@
 """Pydantic models for API request/response validation."""
 
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 import re
 
+# Letters, digits, whitespace and basic punctuation only
+_DISH_NAME_RE = re.compile(r"^[\w\s\-\'\,\.]+$", re.UNICODE)
+
 
 class Ingredient(BaseModel):
     """Single ingredient with quantity and metadata."""
@@ -46,10 +49,11 @@ class RecipeRequest(BaseModel):
         description="Recipe difficulty level",
     )
 
+    @field_validator("dish_name")
     @classmethod
     def validate_dish_name(cls, v: str) -> str:
         """Validate dish name contains only safe characters."""
-        if not re.match(r"^[\w\s\-\'\,\.]+$", v, re.UNICODE):
+        if not _DISH_NAME_RE.match(v):
             raise ValueError("Dish name contains invalid characters")
         return v.strip()
 
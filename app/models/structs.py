@@ -0,0 +1,44 @@
+"""msgspec structs for the recipe response hot path.
+
+These mirror the Pydantic response models in ``schemas.py``, which remain
+the source of truth for request validation and the OpenAPI schema.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import msgspec
+
+
+class IngredientStruct(msgspec.Struct):
+    """Single ingredient with quantity and metadata."""
+
+    name: str
+    quantity: float
+    unit: str
+    category: str
+    notes: Optional[str] = None
+
+
+class RecipeStruct(msgspec.Struct, kw_only=True):
+    """Recipe payload as validated from Gemini and stored in the cache."""
+
+    # kw_only keeps the field (and so JSON key) order of RecipeResponse
+    dish_name: str
+    servings: int
+    total_prep_time_minutes: int
+    cuisine_type: Optional[str] = None
+    ingredients: List[IngredientStruct]
+    cooking_instructions: List[str]
+    cooking_tips: Optional[str] = None
+    nutritional_info: Optional[Dict[str, Any]] = None
+    estimated_cost: Optional[str] = None
+
+
+def validate_recipe(data: Dict[str, Any]) -> RecipeStruct:
+    """Validate raw recipe data, coercing types like Pydantic's lax mode."""
+    return msgspec.convert(data, type=RecipeStruct, strict=False)
+
+
+def validate_ingredient(data: Dict[str, Any]) -> IngredientStruct:
+    """Validate a single raw ingredient, e.g. one parsed from a stream."""
+    return msgspec.convert(data, type=IngredientStruct, strict=False)
@@ -1,22 +1,29 @@
 """Health check endpoints."""
 
-from datetime import datetime
+import time
 
 from fastapi import APIRouter, Request
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
-from app.config import get_settings
+from app.core.rate_limit import rate_limit
 from app.models.schemas import HealthResponse
 
 router = APIRouter(tags=["Health"])
-limiter = Limiter(key_func=get_remote_address)
 
-settings = get_settings()
+# (epoch second, ISO timestamp) - reformatted at most once per second
+_timestamp_cache = [0, ""]
+
+
+def _utc_timestamp() -> str:
+    """Get the current UTC time as an ISO string at second granularity."""
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache[0] = now
+        _timestamp_cache[1] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now))
+    return _timestamp_cache[1]
 
 
 @router.get("/health", response_model=HealthResponse)
-@limiter.limit(settings.rate_limit_health)
+@rate_limit("rate_limit_health")
 async def health_check(request: Request):
     """
     Detailed health check endpoint.
@@ -31,7 +38,7 @@ async def health_check(request: Request):
     """
     # Get cache service from app state
     cache_service = request.app.state.cache_service
-    cache_size = await cache_service._cache.size()
+    cache_size = cache_service.size
 
     # Check Gemini configuration
     gemini_service = request.app.state.gemini_service
@@ -41,6 +48,6 @@ async def health_check(request: Request):
         status="healthy",
         gemini_api=gemini_status,
         cache_size=cache_size,
-        timestamp=datetime.utcnow().isoformat(),
-        version=settings.app_version,
+        timestamp=_utc_timestamp(),
+        version=request.app.state.settings.app_version,
     )
@@ -1,25 +1,83 @@
 """Recipe calculation endpoints."""
 
+import asyncio
 import logging
+from typing import AsyncIterator
 
-from fastapi import APIRouter, Request
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+import msgspec
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import StreamingResponse
 
-from app.config import get_settings
+from app.core.compression import accepts_encoding
+from app.core.rate_limit import rate_limit
 from app.core.exceptions import ServiceUnavailableError, InternalServerError
 from app.models.schemas import RecipeRequest, RecipeResponse, CacheStatsResponse
-from app.services.gemini import GeminiServiceError
+from app.models.structs import RecipeStruct, validate_ingredient, validate_recipe
+from app.services.cache import CachedRecipe
+from app.services.gemini import GeminiService, GeminiServiceError, IngredientStreamParser
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api", tags=["Recipe"])
-limiter = Limiter(key_func=get_remote_address)
 
-settings = get_settings()
+
+def _recipe_response(cached: CachedRecipe, request: Request) -> Response:
+    """Build a JSON response from a serialized recipe, sending stored gzip as-is."""
+    if not cached.gzipped:
+        return Response(
+            content=cached.payload,
+            media_type="application/json",
+            headers={"ETag": cached.etag},
+        )
+
+    headers = {"Vary": "Accept-Encoding"}
+    if accepts_encoding(request.headers.get("accept-encoding", ""), "gzip"):
+        content = cached.body
+        headers.update({"ETag": cached.gzip_etag, "Content-Encoding": "gzip"})
+    else:
+        content = cached.payload
+        headers["ETag"] = cached.etag
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+def _sse_event(event: bytes, data: bytes) -> bytes:
+    """Format a single-line payload as a Server-Sent Event frame."""
+    return b"event: " + event + b"\ndata: " + data + b"\n\n"
+
+
+async def _drain(queue: "asyncio.Queue[str]", task: asyncio.Future) -> AsyncIterator[str]:
+    """Yield items put on ``queue`` until ``task`` finishes."""
+    getter = None
+    try:
+        while True:
+            getter = asyncio.ensure_future(queue.get())
+            await asyncio.wait((getter, task), return_when=asyncio.FIRST_COMPLETED)
+            if not getter.done():
+                break
+            yield getter.result()
+        while not queue.empty():
+            yield queue.get_nowait()
+    finally:
+        if getter is not None:
+            getter.cancel()
+
+
+def _retrieve_exception(task: asyncio.Future) -> None:
+    """Mark a task's exception retrieved; it is reported where the task is awaited."""
+    if not task.cancelled():
+        task.exception()
+
+
+def _require_gemini(gemini_service: GeminiService) -> None:
+    """Raise 503 if the Gemini API key is missing."""
+    if not gemini_service.is_configured:
+        raise ServiceUnavailableError(
+            "Gemini API key not configured. Please set GEMINI_API_KEY environment variable.",
+            details={"error_code": "GEMINI_NOT_CONFIGURED"},
+        )
 
 
 @router.post("/recipe", response_model=RecipeResponse)
-@limiter.limit(settings.rate_limit_recipe)
+@rate_limit("rate_limit_recipe")
 async def get_recipe(request: Request, recipe_request: RecipeRequest):
     """
     Calculate ingredient quantities for a recipe.
@@ -29,6 +87,10 @@ async def get_recipe(request: Request, recipe_request: RecipeRequest):
 
     Rate limit: 10 requests per minute per IP
 
+    Conditional requests: send the ETag of a recipe you already hold in
+    If-None-Match. If it is still current the reply is an empty 412
+    Precondition Failed instead of the payload.
+
     Args:
         recipe_request: Recipe calculation request with dish name and servings
 
@@ -36,6 +98,7 @@ async def get_recipe(request: Request, recipe_request: RecipeRequest):
         Complete recipe with scaled ingredients
 
     Raises:
+        412: If If-None-Match matches the current recipe
         503: If Gemini API is not configured
         500: If AI service encounters an error
     """
@@ -44,40 +107,28 @@ async def get_recipe(request: Request, recipe_request: RecipeRequest):
     gemini_service = request.app.state.gemini_service
 
     # Check if Gemini is configured
-    if not gemini_service.is_configured:
-        raise ServiceUnavailableError(
-            "Gemini API key not configured. Please set GEMINI_API_KEY environment variable.",
-            details={"error_code": "GEMINI_NOT_CONFIGURED"},
-        )
-
-    # Check cache first
-    cached_recipe = await cache_service.get_recipe(
-        recipe_request.dish_name,
-        recipe_request.servings,
-        recipe_request.dietary_restrictions,
-    )
+    _require_gemini(gemini_service)
 
-    if cached_recipe:
-        logger.info(f"Cache hit for {recipe_request.dish_name}")
-        return RecipeResponse(**cached_recipe)
-
-    # Generate recipe using Gemini
-    try:
+    async def build_recipe() -> RecipeStruct:
         recipe_data = await gemini_service.generate_recipe(recipe_request)
 
         # Validate response matches our model
-        response = RecipeResponse(**recipe_data)
+        return validate_recipe(recipe_data)
 
-        # Cache the result
-        await cache_service.set_recipe(
+    # Serve from cache (refreshing stale entries in the background), otherwise
+    # generate with Gemini, sharing one call across concurrent requests.
+    # Cached payloads were validated before storing and are returned as-is.
+    try:
+        cached = await cache_service.get_or_create_recipe(
             recipe_request.dish_name,
             recipe_request.servings,
-            recipe_data,
+            build_recipe,
             recipe_request.dietary_restrictions,
-            ttl=settings.cache_ttl_seconds,
+            ttl=request.app.state.settings.cache_ttl_seconds,
+            cuisine_type=recipe_request.cuisine_type,
         )
 
-        return response
+        return _recipe_response(cached, request)
 
     except GeminiServiceError as e:
         logger.error(f"Gemini service error: {e.message}")
@@ -95,8 +146,91 @@ async def get_recipe(request: Request, recipe_request: RecipeRequest):
         )
 
 
+@router.post("/recipe/stream", response_class=StreamingResponse)
+@rate_limit("rate_limit_recipe")
+async def stream_recipe(request: Request, recipe_request: RecipeRequest):
+    """
+    Stream a recipe as Server-Sent Events while Gemini generates it.
+
+    Emits ``chunk`` events whose data is a JSON-encoded text fragment of the
+    recipe, an ``ingredient`` event as soon as each ingredient is complete,
+    then one ``recipe`` event with the complete validated recipe.
+    Cached recipes (stale ones are refreshed in the background), and
+    recipes already being generated for an identical request, are sent as
+    a single ``recipe`` event. Failures after the
+    stream has started are reported as an ``error`` event.
+
+    Rate limit: 10 requests per minute per IP
+
+    Raises:
+        503: If Gemini API is not configured
+    """
+    cache_service = request.app.state.cache_service
+    gemini_service = request.app.state.gemini_service
+    settings = request.app.state.settings
+
+    _require_gemini(gemini_service)
+
+    async def events() -> AsyncIterator[bytes]:
+        fragments: "asyncio.Queue[str]" = asyncio.Queue()
+
+        async def build_recipe() -> RecipeStruct:
+            parts = []
+            async for fragment in gemini_service.stream_recipe(recipe_request):
+                parts.append(fragment)
+                # A background refresh of a stale hit runs after this flight ended
+                if not flight.done():
+                    fragments.put_nowait(fragment)
+            return validate_recipe(gemini_service.parse_recipe("".join(parts)))
+
+        # Serve from cache (refreshing stale entries in the background), lead a
+        # build that identical requests can join, or join one already in
+        # flight. Only a led build emits chunks; otherwise the flight finishes
+        # without any and just the recipe is sent.
+        flight = asyncio.ensure_future(
+            cache_service.get_or_create_recipe(
+                recipe_request.dish_name,
+                recipe_request.servings,
+                build_recipe,
+                recipe_request.dietary_restrictions,
+                ttl=settings.cache_ttl_seconds,
+                cuisine_type=recipe_request.cuisine_type,
+            )
+        )
+        flight.add_done_callback(_retrieve_exception)
+
+        try:
+            parser = IngredientStreamParser()
+            async for fragment in _drain(fragments, flight):
+                yield _sse_event(b"chunk", msgspec.json.encode(fragment))
+                for item in parser.feed(fragment):
+                    try:
+                        ingredient = validate_ingredient(item)
+                    except msgspec.ValidationError:
+                        continue
+                    yield _sse_event(b"ingredient", msgspec.json.encode(ingredient))
+
+            stored = flight.result()
+            yield _sse_event(b"recipe", stored.payload)
+
+        except GeminiServiceError as e:
+            logger.error(f"Gemini service error while streaming: {e.message}")
+            error = {"message": e.message, "error_code": e.error_code}
+            yield _sse_event(b"error", msgspec.json.encode(error))
+        except Exception as e:
+            logger.error(f"Unexpected error streaming recipe: {e}", exc_info=True)
+            error = {"message": "Failed to generate recipe", "error_code": "INTERNAL_ERROR"}
+            yield _sse_event(b"error", msgspec.json.encode(error))
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"X-Accel-Buffering": "no"},  # Stop proxies from buffering the stream
+    )
+
+
 @router.get("/cache/stats", response_model=CacheStatsResponse)
-@limiter.limit(settings.rate_limit_cache)
+@rate_limit("rate_limit_cache")
 async def cache_stats(request: Request):
     """
     Get cache statistics.
@@ -111,12 +245,12 @@ async def cache_stats(request: Request):
     return CacheStatsResponse(
         cached_recipes=stats["cached_recipes"],
         cache_keys=stats["cache_keys"],
-        max_size=settings.cache_max_size,
+        max_size=request.app.state.settings.cache_max_size,
     )
 
 
 @router.delete("/cache/clear")
-@limiter.limit(settings.rate_limit_cache)
+@rate_limit("rate_limit_cache")
 async def clear_cache(request: Request):
     """
     Clear all cached recipes.
@@ -1,6 +1,6 @@
 """Business logic services."""
 
-from .cache import CacheService, InMemoryCache
+from .cache import CacheService, DiskCache, InMemoryCache
 from .gemini import GeminiService
 
-__all__ = ["CacheService", "InMemoryCache", "GeminiService"]
+__all__ = ["CacheService", "DiskCache", "InMemoryCache", "GeminiService"]
@@ -1,11 +1,25 @@
 """Cache service with TTL support and Redis-ready interface."""
 
 import asyncio
+import gzip
 import hashlib
+import heapq
 import logging
+import math
+import sqlite3
+import threading
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import msgspec
+import xxhash
+import zstandard
 
 logger = logging.getLogger(__name__)
 
@@ -43,135 +57,430 @@ class CacheInterface(ABC):
         """Get a sample of cache keys."""
         pass
 
+    @abstractmethod
+    def __len__(self) -> int:
+        """Get the number of stored items without awaiting (may include expired)."""
+        pass
+
 
 class CacheEntry:
     """A cache entry with value and expiry time."""
 
     def __init__(self, value: Any, ttl_seconds: Optional[int] = None):
         self.value = value
-        self.created_at = datetime.utcnow()
-        self.expires_at = (
-            self.created_at + timedelta(seconds=ttl_seconds) if ttl_seconds else None
-        )
+        self.accessed = False  # Set on every hit, cleared when the entry moves
+        # Monotonic, so expiry is cheap to check and immune to wall-clock jumps
+        self.expires_at = time.monotonic() + ttl_seconds if ttl_seconds else None
 
     @property
     def is_expired(self) -> bool:
         """Check if the entry has expired."""
-        if self.expires_at is None:
-            return False
-        return datetime.utcnow() > self.expires_at
+        return self.expires_at is not None and time.monotonic() > self.expires_at
+
+
+class CachedRecipe:
+    """
+    Serialized recipe payload with its precomputed ETag and freshness.
+
+    Payloads over ``GZIP_MIN_SIZE`` bytes are kept gzip-compressed, so they
+    take less memory and can be sent as-is to clients that accept gzip.
+    """
+
+    GZIP_MIN_SIZE = 1024
+
+    __slots__ = ("body", "gzipped", "etag", "fresh_until")
+
+    def __init__(self, payload: bytes, fresh_for: Optional[float] = None):
+        self.etag = f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+        self.gzipped = len(payload) > self.GZIP_MIN_SIZE
+        # Compressed once per generated recipe, so spend on ratio over speed
+        self.body = gzip.compress(payload, compresslevel=9, mtime=0) if self.gzipped else payload
+        self.fresh_until = time.monotonic() + fresh_for if fresh_for else None
+
+    @property
+    def payload(self) -> bytes:
+        """The uncompressed JSON payload."""
+        return gzip.decompress(self.body) if self.gzipped else self.body
+
+    @property
+    def gzip_etag(self) -> str:
+        """ETag of the gzip-encoded representation."""
+        return self.etag[:-1] + '-gzip"'
+
+    @property
+    def is_stale(self) -> bool:
+        """Check if the recipe is past its TTL and should be refreshed."""
+        return self.fresh_until is not None and time.monotonic() > self.fresh_until
+
+
+class _FrequencySketch:
+    """
+    Count-min sketch of 4-bit access counters (TinyLFU).
+
+    Counters are halved every ``sample_size`` increments so that popularity
+    ages out and yesterday's hot dish does not stay admitted forever.
+    """
+
+    _MAX_COUNT = 15
+    # Odd 64-bit multipliers, one per row (depth 4)
+    _SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93)
+    _MASK64 = (1 << 64) - 1
+
+    def __init__(self, capacity: int):
+        width = 16
+        while width < capacity * 4:
+            width <<= 1
+        # Multiplicative hashing: the top bits of hash * seed pick the counter
+        self._shift = 64 - (width.bit_length() - 1)
+        self._table = array("B", bytes(width))
+        self._sample_size = 10 * capacity
+        self._additions = 0
+
+    def _indexes(self, key: str) -> List[int]:
+        h = hash(key) & self._MASK64
+        return [((h * seed) & self._MASK64) >> self._shift for seed in self._SEEDS]
+
+    def increment(self, key: str) -> None:
+        """Record one access of ``key``."""
+        table = self._table
+        for i in self._indexes(key):
+            if table[i] < self._MAX_COUNT:
+                table[i] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._table = array("B", (count >> 1 for count in table))
+            self._additions //= 2
+
+    def frequency(self, key: str) -> int:
+        """Estimate how often ``key`` was accessed recently."""
+        table = self._table
+        return min(table[i] for i in self._indexes(key))
 
 
 class InMemoryCache(CacheInterface):
-    """In-memory cache implementation with TTL support."""
+    """
+    In-memory cache implementation with TTL support and scan-resistant eviction.
+
+    Entries live in three segments, as in a TU-Q / W-TinyLFU cache: new
+    entries enter ``hot`` (10%), entries that are hit again move to ``warm``
+    (10%), and the rest age in ``cold`` (80%) until evicted. A hit only sets
+    the entry's accessed flag; entries are moved when their segment overflows.
+    An unaccessed entry leaving ``hot`` is only admitted to a full ``cold``
+    segment if the frequency sketch says it is more popular than the entry it
+    would displace, so a burst of one-off dishes cannot flush popular ones.
+
+    No method awaits internally, so each call runs atomically on the event
+    loop and no lock is needed. Adding an await would require one again.
+    """
 
     def __init__(self, max_size: int = 1000, default_ttl: int = 3600):
-        self._cache: Dict[str, CacheEntry] = {}
+        # Each segment is ordered oldest first
+        self._hot: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._warm: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._cold: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        # Floored at one entry, but hot + warm never exceed max_size since only cold evicts
+        self._hot_capacity = min(max(1, max_size // 10), max_size)
+        self._warm_capacity = min(max(1, max_size // 10), max_size - self._hot_capacity)
+        self._sketch = _FrequencySketch(max_size)
+        # (expires_at, key) min-heap; entries may be stale if the key was re-set or evicted
+        self._expiry_heap: List[Tuple[float, str]] = []
         self._max_size = max_size
         self._default_ttl = default_ttl
-        self._lock = asyncio.Lock()
-        self._access_order: List[str] = []  # For LRU eviction
+
+    def _segment_of(self, key: str) -> Optional["OrderedDict[str, CacheEntry]"]:
+        """Find the segment currently holding ``key``."""
+        for segment in (self._hot, self._warm, self._cold):
+            if key in segment:
+                return segment
+        return None
 
     async def get(self, key: str) -> Optional[Any]:
         """Get a value from cache, returns None if expired or not found."""
-        async with self._lock:
-            entry = self._cache.get(key)
-            if entry is None:
-                return None
+        self._sketch.increment(key)
+        segment = self._segment_of(key)
+        if segment is None:
+            return None
 
-            if entry.is_expired:
-                # Remove expired entry
-                del self._cache[key]
-                if key in self._access_order:
-                    self._access_order.remove(key)
-                logger.debug(f"Cache entry expired: {key}")
-                return None
+        entry = segment[key]
+        if entry.is_expired:
+            # Remove expired entry
+            del segment[key]
+            logger.debug(f"Cache entry expired: {key}")
+            return None
 
-            # Update access order for LRU
-            if key in self._access_order:
-                self._access_order.remove(key)
-            self._access_order.append(key)
+        entry.accessed = True
 
-            logger.debug(f"Cache hit: {key}")
-            return entry.value
+        logger.debug(f"Cache hit: {key}")
+        return entry.value
 
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Set a value in cache with optional TTL."""
-        async with self._lock:
-            # Evict entries if at max capacity
-            while len(self._cache) >= self._max_size and self._access_order:
-                oldest_key = self._access_order.pop(0)
-                if oldest_key in self._cache:
-                    del self._cache[oldest_key]
-                    logger.debug(f"Evicted cache entry: {oldest_key}")
-
-            # Create new entry
-            effective_ttl = ttl if ttl is not None else self._default_ttl
-            self._cache[key] = CacheEntry(value, effective_ttl)
-
-            # Update access order
-            if key in self._access_order:
-                self._access_order.remove(key)
-            self._access_order.append(key)
+        effective_ttl = ttl if ttl is not None else self._default_ttl
+        entry = CacheEntry(value, effective_ttl)
+
+        # Drain before storing: a heap rebuild here must not miss the new entry
+        self._drain_expired()
+
+        segment = self._segment_of(key)
+        if segment is not None:
+            # Replace in place, keeping the entry's position and history
+            entry.accessed = segment[key].accessed
+            segment[key] = entry
+        else:
+            self._hot[key] = entry
+            self._cycle()
+
+        if entry.expires_at is not None:
+            heapq.heappush(self._expiry_heap, (entry.expires_at, key))
+
+        logger.debug(f"Cache set: {key}")
+
+    def _drain_expired(self) -> None:
+        """Remove expired entries in expiry order, O(log n) per heap item."""
+        heap = self._expiry_heap
+        now = time.monotonic()
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            segment = self._segment_of(key)
+            # Skip keys that were re-set with a later expiry since
+            if segment is not None and segment[key].expires_at == expires_at:
+                del segment[key]
+                logger.debug(f"Cache entry expired: {key}")
 
-            logger.debug(f"Cache set: {key}")
+        # Evicted and re-set keys leave stale items behind; rebuild when they dominate
+        if len(heap) > 2 * len(self) + 64:
+            self._expiry_heap = [
+                (entry.expires_at, key)
+                for segment in (self._hot, self._warm, self._cold)
+                for key, entry in segment.items()
+                if entry.expires_at is not None
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def _cycle(self) -> None:
+        """Move entries out of overflowing segments, evicting once over capacity."""
+        while len(self._hot) > self._hot_capacity:
+            key, entry = self._hot.popitem(last=False)
+            if entry.accessed:
+                entry.accessed = False
+                self._warm[key] = entry
+            elif self._admit(key):
+                self._cold[key] = entry
+            else:
+                logger.debug(f"Evicted cache entry: {key}")
+        self._cycle_warm()
+        while len(self) > self._max_size and self._cold:
+            key, entry = self._cold.popitem(last=False)
+            if entry.accessed and not entry.is_expired:
+                entry.accessed = False
+                self._warm[key] = entry
+                self._cycle_warm()
+            else:
+                logger.debug(f"Evicted cache entry: {key}")
+
+    def _cycle_warm(self) -> None:
+        """Demote unaccessed entries from an overflowing warm segment to cold."""
+        while len(self._warm) > self._warm_capacity:
+            key, entry = self._warm.popitem(last=False)
+            if entry.accessed:
+                # Second chance within warm
+                entry.accessed = False
+                self._warm[key] = entry
+            else:
+                self._cold[key] = entry
+
+    def _admit(self, key: str) -> bool:
+        """TinyLFU admission: whether ``key`` should displace cold's oldest entry."""
+        if len(self) < self._max_size or not self._cold:
+            return True
+        victim = next(iter(self._cold))
+        return self._sketch.frequency(key) > self._sketch.frequency(victim)
 
     async def delete(self, key: str) -> bool:
         """Delete a value from cache."""
-        async with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                if key in self._access_order:
-                    self._access_order.remove(key)
-                logger.debug(f"Cache deleted: {key}")
-                return True
-            return False
+        segment = self._segment_of(key)
+        if segment is not None:
+            del segment[key]
+            logger.debug(f"Cache deleted: {key}")
+            return True
+        return False
 
     async def clear(self) -> None:
         """Clear all cached values."""
-        async with self._lock:
-            self._cache.clear()
-            self._access_order.clear()
-            logger.info("Cache cleared")
+        self._hot.clear()
+        self._warm.clear()
+        self._cold.clear()
+        self._expiry_heap.clear()
+        logger.info("Cache cleared")
 
     async def size(self) -> int:
         """Get the number of cached items (excluding expired)."""
-        async with self._lock:
-            # Clean up expired entries
-            expired_keys = [k for k, v in self._cache.items() if v.is_expired]
-            for key in expired_keys:
-                del self._cache[key]
-                if key in self._access_order:
-                    self._access_order.remove(key)
-            return len(self._cache)
+        self._drain_expired()
+        return len(self)
 
     async def keys(self, limit: int = 10) -> List[str]:
         """Get a sample of cache keys."""
-        async with self._lock:
-            return list(self._cache.keys())[:limit]
+        return list(islice(chain(self._hot, self._warm, self._cold), limit))
+
+    def __len__(self) -> int:
+        """Get the number of stored items, including not yet purged expired ones."""
+        return len(self._hot) + len(self._warm) + len(self._cold)
+
+
+class DiskCache:
+    """
+    Persistent SQLite store for serialized recipes (L2 behind the memory cache).
+
+    Survives restarts and is shared by every worker process using the same
+    file. Payloads are zstd-compressed; freshness is kept as wall-clock time
+    so it stays meaningful across processes. Expired rows are purged on
+    open and every ``PURGE_EVERY`` writes so the file does not grow forever.
+    """
+
+    PURGE_EVERY = 100
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        # One connection and zstd context shared across worker threads
+        self._lock = threading.Lock()
+        self._compressor = zstandard.ZstdCompressor(level=3)
+        self._decompressor = zstandard.ZstdDecompressor()
+        self._writes = 0
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS recipes ("
+                "key BLOB PRIMARY KEY, value BLOB NOT NULL, fresh_until REAL, expires_at REAL"
+                ") WITHOUT ROWID"
+            )
+            self._purge_expired()
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+
+    @staticmethod
+    def _digest(key: str) -> bytes:
+        return hashlib.sha256(key.encode()).digest()
+
+    async def get(self, key: str) -> Optional[Tuple[CachedRecipe, Optional[float]]]:
+        """Load a recipe and its remaining storage lifetime, or None if absent or expired."""
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(
+        self, key: str, cached: CachedRecipe, ttl: Optional[int], storage_ttl: Optional[int]
+    ) -> None:
+        """Store a recipe, fresh for ``ttl`` and kept for ``storage_ttl`` seconds."""
+        await asyncio.to_thread(self._set, key, cached.payload, ttl, storage_ttl)
+
+    async def clear(self) -> None:
+        """Delete every stored recipe."""
+        await asyncio.to_thread(self._execute, "DELETE FROM recipes", ())
+
+    def _get(self, key: str) -> Optional[Tuple[CachedRecipe, Optional[float]]]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, fresh_until, expires_at FROM recipes WHERE key = ?",
+                (self._digest(key),),
+            ).fetchone()
+            if row is None or (row[2] is not None and row[2] <= now):
+                return None
+            try:
+                payload = self._decompressor.decompress(row[0])
+                msgspec.json.decode(payload)
+            except (zstandard.ZstdError, msgspec.DecodeError) as e:
+                # Corrupt or truncated row: drop it and treat as a miss
+                logger.warning(f"Discarding unreadable disk cache entry: {e}")
+                self._conn.execute("DELETE FROM recipes WHERE key = ?", (self._digest(key),))
+                return None
+
+        _, fresh_until, expires_at = row
+        fresh_for = fresh_until - now if fresh_until is not None else None
+        expires_in = expires_at - now if expires_at is not None else None
+        return CachedRecipe(payload, fresh_for), expires_in
+
+    def _set(
+        self, key: str, payload: bytes, ttl: Optional[int], storage_ttl: Optional[int]
+    ) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO recipes VALUES (?, ?, ?, ?)",
+                (
+                    self._digest(key),
+                    self._compressor.compress(payload),
+                    now + ttl if ttl else None,
+                    now + storage_ttl if storage_ttl else None,
+                ),
+            )
+            self._writes += 1
+            if self._writes % self.PURGE_EVERY == 0:
+                self._conn.execute("DELETE FROM recipes WHERE expires_at <= ?", (now,))
+
+    def _purge_expired(self) -> None:
+        """Delete rows past their storage lifetime."""
+        self._execute("DELETE FROM recipes WHERE expires_at <= ?", (time.time(),))
+
+    def _execute(self, sql: str, params: tuple) -> None:
+        with self._lock:
+            self._conn.execute(sql, params)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+@lru_cache(maxsize=2048)
+def _recipe_key(
+    dish_name: str,
+    servings: int,
+    dietary_restrictions: Tuple[str, ...],
+    cuisine_type: Optional[str],
+) -> str:
+    """Normalize and hash recipe request fields; memoized as clients resubmit often."""
+    dietary_str = "_".join(sorted(dietary_restrictions))
+    cuisine_str = cuisine_type.lower().strip() if cuisine_type else ""
+    key_string = f"{dish_name.lower().strip()}_{servings}_{dietary_str}_{cuisine_str}"
+    return xxhash.xxh3_128_hexdigest(key_string.encode())
 
 
 class CacheService:
     """High-level cache service with key generation utilities."""
 
-    def __init__(self, cache: CacheInterface):
+    def __init__(
+        self, cache: CacheInterface, stale_grace: int = 0, disk: Optional[DiskCache] = None
+    ):
         self._cache = cache
+        self._disk = disk  # Optional persistent tier consulted on memory misses
+        self._stale_grace = stale_grace  # How long past TTL a stale recipe may be served
+        self._inflight: Dict[str, asyncio.Future] = {}  # Single-flight registry
+        self._refresh_tasks: Set[asyncio.Task] = set()  # Keep background refreshes alive
 
     @staticmethod
     def generate_recipe_key(
-        dish_name: str, servings: int, dietary_restrictions: Optional[List[str]] = None
+        dish_name: str,
+        servings: int,
+        dietary_restrictions: Optional[List[str]] = None,
+        cuisine_type: Optional[str] = None,
     ) -> str:
-        """Generate a unique cache key for a recipe request."""
-        dietary_str = "_".join(sorted(dietary_restrictions)) if dietary_restrictions else ""
-        key_string = f"{dish_name.lower().strip()}_{servings}_{dietary_str}"
-        return hashlib.md5(key_string.encode()).hexdigest()
+        """Generate a unique cache key from every request field the prompt uses."""
+        return _recipe_key(
+            dish_name, servings, tuple(dietary_restrictions or ()), cuisine_type
+        )
 
     async def get_recipe(
-        self, dish_name: str, servings: int, dietary_restrictions: Optional[List[str]] = None
-    ) -> Optional[Any]:
-        """Get a cached recipe."""
-        key = self.generate_recipe_key(dish_name, servings, dietary_restrictions)
-        return await self._cache.get(key)
+        self,
+        dish_name: str,
+        servings: int,
+        dietary_restrictions: Optional[List[str]] = None,
+        cuisine_type: Optional[str] = None,
+    ) -> Optional[CachedRecipe]:
+        """Get a cached recipe (possibly stale) as serialized JSON with its ETag."""
+        key = self.generate_recipe_key(dish_name, servings, dietary_restrictions, cuisine_type)
+        return await self._lookup(key)
 
     async def set_recipe(
         self,
@@ -180,14 +489,128 @@ class CacheService:
         recipe_data: Any,
         dietary_restrictions: Optional[List[str]] = None,
         ttl: Optional[int] = None,
+        cuisine_type: Optional[str] = None,
+    ) -> CachedRecipe:
+        """Cache a recipe as serialized JSON and return the stored entry."""
+        key = self.generate_recipe_key(dish_name, servings, dietary_restrictions, cuisine_type)
+        return await self._store(key, recipe_data, ttl)
+
+    async def get_or_create_recipe(
+        self,
+        dish_name: str,
+        servings: int,
+        factory: Callable[[], Awaitable[Any]],
+        dietary_restrictions: Optional[List[str]] = None,
+        ttl: Optional[int] = None,
+        cuisine_type: Optional[str] = None,
+    ) -> CachedRecipe:
+        """
+        Get a cached recipe, building it with ``factory`` on a miss.
+
+        Concurrent misses for the same key share a single ``factory`` call;
+        later callers await the first caller's result (or exception). A stale
+        hit is returned immediately while ``factory`` refreshes it in the
+        background (stale-while-revalidate).
+        """
+        key = self.generate_recipe_key(dish_name, servings, dietary_restrictions, cuisine_type)
+
+        cached = await self._lookup(key)
+        if cached is not None:
+            if cached.is_stale and key not in self._inflight:
+                logger.debug(f"Serving stale recipe while refreshing: {key}")
+                self._refresh_in_background(key, factory, ttl)
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            logger.debug(f"Awaiting in-flight recipe: {key}")
+            return await asyncio.shield(inflight)
+
+        return await self._fly(key, self._begin_flight(key), factory, ttl)
+
+    async def _lookup(self, key: str) -> Optional[CachedRecipe]:
+        """Get a recipe from memory, falling back to (and promoting from) disk."""
+        cached = await self._cache.get(key)
+        if cached is not None or self._disk is None:
+            return cached
+
+        try:
+            found = await self._disk.get(key)
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache read failed: {e}")
+            return None
+        if found is None:
+            return None
+
+        cached, expires_in = found
+        logger.debug(f"Disk cache hit: {key}")
+        await self._cache.set(key, cached, math.ceil(expires_in) if expires_in else None)
+        return cached
+
+    async def _store(self, key: str, recipe_data: Any, ttl: Optional[int]) -> CachedRecipe:
+        """Serialize and store a recipe, keeping it past its TTL for the grace period."""
+        cached = CachedRecipe(msgspec.json.encode(recipe_data), ttl)
+        storage_ttl = ttl + self._stale_grace if ttl else ttl
+        await self._cache.set(key, cached, storage_ttl)
+        if self._disk is not None:
+            try:
+                await self._disk.set(key, cached, ttl, storage_ttl)
+            except sqlite3.Error as e:
+                logger.warning(f"Disk cache write failed: {e}")
+        return cached
+
+    def _begin_flight(self, key: str) -> asyncio.Future:
+        """Register an in-flight build for ``key`` before any await can interleave."""
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        return future
+
+    async def _fly(
+        self,
+        key: str,
+        future: asyncio.Future,
+        factory: Callable[[], Awaitable[Any]],
+        ttl: Optional[int],
+    ) -> CachedRecipe:
+        """Build and cache a recipe, publishing the outcome to waiting callers."""
+        try:
+            cached = await self._store(key, await factory(), ttl)
+            future.set_result(cached)
+            return cached
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved in case nobody else was waiting
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def _refresh_in_background(
+        self, key: str, factory: Callable[[], Awaitable[Any]], ttl: Optional[int]
     ) -> None:
-        """Cache a recipe."""
-        key = self.generate_recipe_key(dish_name, servings, dietary_restrictions)
-        await self._cache.set(key, recipe_data, ttl)
+        """Start a background refresh of a stale recipe."""
+        task = asyncio.create_task(self._fly(key, self._begin_flight(key), factory, ttl))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._on_refresh_done)
+
+    def _on_refresh_done(self, task: asyncio.Task) -> None:
+        """Forget a finished refresh task and log its failure, if any."""
+        self._refresh_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Background recipe refresh failed: {task.exception()}")
+
+    @property
+    def size(self) -> int:
+        """Number of stored recipes, cheap enough for frequent health probes."""
+        return len(self._cache)
 
     async def clear(self) -> None:
         """Clear all cached recipes."""
         await self._cache.clear()
+        if self._disk is not None:
+            await self._disk.clear()
 
     async def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
@@ -225,3 +648,6 @@ class RedisCache(CacheInterface):
 
     async def keys(self, limit: int = 10) -> List[str]:
         pass
+
+    def __len__(self) -> int:
+        pass
@@ -3,15 +3,166 @@
 import json
 import logging
 import re
-from typing import Optional
+from typing import AsyncIterator, List, Optional, Tuple
 
 import google.generativeai as genai
+import orjson
 
 from app.config import Settings
 from app.models.schemas import RecipeRequest
 
 logger = logging.getLogger(__name__)
 
+_PROMPT_TEMPLATE = """Chef recipe: "{dish}" for {servings} servings.{extras}
+
+SCALE: Protein 150g/person, Veg 120g/person, Grain 80g/person. Spices scale 1.5x when doubling. Liquids scale 80%.
+
+UNITS: grams(solids), ml(liquids), tsp(<10g). Include oil,salt,water.
+
+Short clear steps. Pro tips."""
+
+_STRING = genai.protos.Schema(type=genai.protos.Type.STRING)
+_INTEGER = genai.protos.Schema(type=genai.protos.Type.INTEGER)
+
+# Mirrors RecipeResponse; Gemini's constrained decoding guarantees this shape
+_RECIPE_SCHEMA = genai.protos.Schema(
+    type=genai.protos.Type.OBJECT,
+    properties={
+        "dish_name": _STRING,
+        "servings": _INTEGER,
+        "total_prep_time_minutes": _INTEGER,
+        "cuisine_type": _STRING,
+        "ingredients": genai.protos.Schema(
+            type=genai.protos.Type.ARRAY,
+            items=genai.protos.Schema(
+                type=genai.protos.Type.OBJECT,
+                properties={
+                    "name": _STRING,
+                    "quantity": genai.protos.Schema(type=genai.protos.Type.NUMBER),
+                    "unit": _STRING,
+                    "category": genai.protos.Schema(
+                        type=genai.protos.Type.STRING,
+                        format_="enum",
+                        enum=[
+                            "protein", "vegetable", "grain", "dairy",
+                            "spice", "oil", "condiment", "other",
+                        ],
+                    ),
+                    "notes": _STRING,
+                },
+                required=["name", "quantity", "unit", "category"],
+            ),
+        ),
+        "cooking_instructions": genai.protos.Schema(
+            type=genai.protos.Type.ARRAY, items=_STRING
+        ),
+        "cooking_tips": _STRING,
+        "nutritional_info": genai.protos.Schema(
+            type=genai.protos.Type.OBJECT,
+            properties={
+                "calories_per_serving": _INTEGER,
+                "protein_grams": _INTEGER,
+                "carbs_grams": _INTEGER,
+                "fat_grams": _INTEGER,
+            },
+        ),
+        "estimated_cost": _STRING,
+    },
+    required=[
+        "dish_name", "servings", "total_prep_time_minutes", "cuisine_type",
+        "ingredients", "cooking_instructions", "cooking_tips",
+        "nutritional_info", "estimated_cost",
+    ],
+)
+
+
+_INGREDIENTS_ARRAY_RE = re.compile(r'"ingredients"\s*:\s*\[')
+
+
+def _recovery_cuts(text: str) -> List[Tuple[int, str]]:
+    """
+    Find where broken JSON can be cut so the prefix is a complete document.
+
+    Returns ``(end, closers)`` pairs in text order: ``text[:end]`` ends just
+    after an opening bracket or a complete value (before a comma or after a
+    closing bracket), and
+    ``closers`` closes every container still open at that point. One pass
+    tracks string state, so brackets inside strings are ignored.
+    """
+    cuts = []
+    closers: List[str] = []
+    in_string = escaped = False
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in '{[':
+            closers.append('}' if ch == '{' else ']')
+            cuts.append((i + 1, ''.join(reversed(closers))))
+        elif ch in '}]':
+            if closers:
+                closers.pop()
+            cuts.append((i + 1, ''.join(reversed(closers))))
+        elif ch == ',' and closers:
+            cuts.append((i, ''.join(reversed(closers))))
+    return cuts
+
+
+class IngredientStreamParser:
+    """
+    Incrementally extract complete ingredients from streamed recipe JSON.
+
+    Feed text fragments as they arrive; each call returns the ingredient
+    objects completed since the last one, so clients can render them before
+    the rest of the recipe is generated.
+    """
+
+    _decoder = json.JSONDecoder()
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos: Optional[int] = None  # Next unread index inside the array
+        self._done = False
+
+    def feed(self, fragment: str) -> List[dict]:
+        """Add a text fragment and return newly completed ingredients."""
+        if self._done:
+            return []
+        self._buffer += fragment
+
+        if self._pos is None:
+            match = _INGREDIENTS_ARRAY_RE.search(self._buffer)
+            if match is None:
+                return []
+            self._pos = match.end()
+
+        items = []
+        buffer = self._buffer
+        while True:
+            # Skip separators between array elements
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in ", \t\r\n":
+                pos += 1
+            self._pos = pos
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == "]":
+                self._done = True
+                break
+            try:
+                item, self._pos = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break  # Element still incomplete
+            if isinstance(item, dict):
+                items.append(item)
+        return items
+
 
 class GeminiServiceError(Exception):
     """Exception raised when Gemini API call fails."""
@@ -38,13 +189,14 @@ class GeminiService:
         try:
             genai.configure(api_key=self._settings.gemini_api_key)
 
-            # Configure model with JSON output mode
+            # Configure model with schema-constrained JSON output
             generation_config = genai.GenerationConfig(
                 temperature=self._settings.gemini_temperature,
                 top_p=self._settings.gemini_top_p,
                 top_k=self._settings.gemini_top_k,
                 max_output_tokens=self._settings.gemini_max_output_tokens,
                 response_mime_type="application/json",
+                response_schema=_RECIPE_SCHEMA,
             )
 
             self._model = genai.GenerativeModel(
@@ -70,89 +222,37 @@ class GeminiService:
         if request.dietary_restrictions:
             extras += f" Diet:{','.join(request.dietary_restrictions)}."
 
-        prompt = f"""Chef recipe: "{request.dish_name}" for {request.servings} servings.{extras}
-
-SCALE: Protein 150g/person, Veg 120g/person, Grain 80g/person. Spices scale 1.5x when doubling. Liquids scale 80%.
-
-UNITS: grams(solids), ml(liquids), tsp(<10g). Include oil,salt,water.
-
-CATEGORIES: protein|vegetable|grain|dairy|spice|oil|condiment|other
-
-Return JSON:{{"dish_name":"{request.dish_name}","servings":{request.servings},"total_prep_time_minutes":0,"cuisine_type":"","difficulty":"medium","ingredients":[{{"name":"","quantity":0,"unit":"grams","category":"","notes":""}}],"cooking_instructions":[""],"cooking_tips":"","nutritional_info":{{"calories_per_serving":0,"protein_grams":0,"carbs_grams":0,"fat_grams":0}},"estimated_cost":"$0"}}
-
-Short clear steps. Pro tips. Valid JSON only."""
-        return prompt
+        return _PROMPT_TEMPLATE.format(
+            dish=request.dish_name, servings=request.servings, extras=extras
+        )
 
     def _parse_response(self, response_text: str) -> dict:
-        """Parse and validate the Gemini response."""
-        text = response_text.strip()
-
-        # Remove markdown code blocks if present
-        if text.startswith("```json"):
-            text = text[7:]
-        elif text.startswith("```"):
-            text = text[3:]
-        if text.endswith("```"):
-            text = text[:-3]
-        text = text.strip()
-
-        # Fix common JSON issues
-        text = re.sub(r',(\s*[}\]])', r'\1', text)  # Remove trailing commas
-
-        # Check if JSON is truncated (incomplete)
-        open_braces = text.count('{') - text.count('}')
-        open_brackets = text.count('[') - text.count(']')
-
-        if open_brackets > 0 or open_braces > 0:
-            logger.warning("Incomplete JSON detected. Attempting to fix...")
-
-            # Check for unclosed string by counting unescaped quotes
-            # Remove escaped quotes for counting
-            temp = text.replace('\\"', '')
-            quote_count = temp.count('"')
-
-            if quote_count % 2 == 1:
-                # Odd number of quotes means unclosed string
-                # Find last quote and close the string
-                text = text.rstrip()
-                if not text.endswith('"'):
-                    text += '"'
-
-            # Clean up and close brackets/braces
-            text = text.rstrip(',\n\t ')
-            text += ']' * open_brackets
-            text += '}' * open_braces
-
+        """Parse the Gemini response, salvaging what it can if output was cut off."""
         try:
-            return json.loads(text)
-        except json.JSONDecodeError as e:
+            return orjson.loads(response_text)
+        except orjson.JSONDecodeError as e:
             logger.error(f"JSON decode error: {e}")
-            logger.error(f"Response (first 1000 chars):\n{text[:1000]}")
-
-            # Last resort: try to extract partial data
-            try:
-                # Find the last valid JSON object
-                for i in range(len(text), 0, -1):
-                    try:
-                        partial = text[:i]
-                        # Try to close it
-                        partial = partial.rstrip(',\n\t ')
-                        open_b = partial.count('{') - partial.count('}')
-                        open_br = partial.count('[') - partial.count(']')
-                        partial += ']' * open_br + '}' * open_b
-                        result = json.loads(partial)
-                        logger.warning("Recovered partial JSON data")
-                        return result
-                    except:
-                        continue
-            except:
-                pass
+            logger.error(f"Response (first 1000 chars):\n{response_text[:1000]}")
+
+            # The schema guarantees well-formed JSON unless generation hit
+            # max_output_tokens; keep the longest prefix ending on a complete value
+            for end, closers in reversed(_recovery_cuts(response_text)):
+                try:
+                    result = orjson.loads(response_text[:end] + closers)
+                except orjson.JSONDecodeError:
+                    continue
+                logger.warning("Recovered partial JSON data")
+                return result
 
             raise GeminiServiceError(
                 "Failed to parse recipe data from AI.",
                 error_code="JSON_PARSE_ERROR"
             )
 
+    def parse_recipe(self, response_text: str) -> dict:
+        """Parse complete recipe JSON text, e.g. accumulated from a stream."""
+        return self._parse_response(response_text)
+
     async def generate_recipe(self, request: RecipeRequest) -> dict:
         """Generate a recipe using Gemini AI."""
         if not self._configured:
@@ -164,7 +264,7 @@ Short clear steps. Pro tips. Valid JSON only."""
         prompt = self._build_prompt(request)
 
         try:
-            response = self._model.generate_content(prompt)
+            response = await self._model.generate_content_async(prompt)
 
             if not response.text:
                 raise GeminiServiceError("Empty response from AI", error_code="EMPTY_RESPONSE")
@@ -178,3 +278,25 @@ Short clear steps. Pro tips. Valid JSON only."""
         except Exception as e:
             logger.error(f"Gemini API error: {str(e)}")
             raise GeminiServiceError(f"AI service error: {str(e)}", error_code="API_ERROR")
+
+    async def stream_recipe(self, request: RecipeRequest) -> AsyncIterator[str]:
+        """Stream raw recipe JSON text fragments from Gemini as they arrive."""
+        if not self._configured:
+            raise GeminiServiceError(
+                "Gemini API key not configured.",
+                error_code="NOT_CONFIGURED"
+            )
+
+        prompt = self._build_prompt(request)
+
+        try:
+            response = await self._model.generate_content_async(prompt, stream=True)
+            async for chunk in response:
+                if chunk.text:
+                    yield chunk.text
+
+        except GeminiServiceError:
+            raise
+        except Exception as e:
+            logger.error(f"Gemini API streaming error: {str(e)}")
+            raise GeminiServiceError(f"AI service error: {str(e)}", error_code="API_ERROR")
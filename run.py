@@ -11,12 +11,13 @@ def main():
     settings = get_settings()
 
     gemini_status = "Configured" if settings.is_gemini_configured else "Not configured (set GEMINI_API_KEY)"
+    docs_url = f"http://localhost:{settings.port}/docs" if settings.debug else "Disabled (set DEBUG=true)"
     print(f"""
 ============================================================
      Recipe Ingredient Calculator API  v{settings.app_version}
 ============================================================
   Server: http://{settings.host}:{settings.port}
-  Docs:   http://localhost:{settings.port}/docs
+  Docs:   {docs_url}
   Health: http://localhost:{settings.port}/health
 ------------------------------------------------------------
   Gemini API: {gemini_status}
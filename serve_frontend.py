@@ -1,15 +1,20 @@
 """Simple HTTP server to serve the frontend for development."""
 
 import http.server
-import socketserver
+import mimetypes
 import os
 import sys
 import webbrowser
 from functools import partial
+from typing import Dict, Tuple
+from urllib.parse import unquote, urlsplit
 
 PORT = 3000
 FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend")
 
+# URL path -> (mtime_ns, content, content type), preloaded at startup
+FILES: Dict[str, Tuple[int, bytes, str]] = {}
+
 
 class CORSHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     """HTTP handler with CORS headers for development."""
@@ -24,13 +29,62 @@ class CORSHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         self.send_response(200)
         self.end_headers()
 
+    def do_GET(self):
+        path = unquote(urlsplit(self.path).path)
+        if path.endswith("/"):
+            path += "index.html"
+        cached = FILES.get(path)
+        if cached is None:
+            super().do_GET()
+            return
+
+        # One stat instead of open/fstat/read; picks up edits made while serving
+        fs_path = os.path.join(FRONTEND_DIR, path.lstrip("/"))
+        try:
+            mtime = os.stat(fs_path).st_mtime_ns
+        except OSError:
+            FILES.pop(path, None)
+            super().do_GET()
+            return
+        if cached[0] != mtime:
+            cached = load_file(path, fs_path)
+
+        _, content, content_type = cached
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+def load_file(path, fs_path):
+    """Read a frontend file into the in-memory cache."""
+    with open(fs_path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        content = f.read()
+    content_type = CORSHTTPRequestHandler.extensions_map.get(
+        os.path.splitext(fs_path)[1].lower()
+    ) or mimetypes.guess_type(fs_path)[0] or "application/octet-stream"
+    FILES[path] = cached = (stat.st_mtime_ns, content, content_type)
+    return cached
+
+
+def load_frontend():
+    """Preload every frontend file so requests are served from memory."""
+    for root, _, names in os.walk(FRONTEND_DIR):
+        for name in names:
+            fs_path = os.path.join(root, name)
+            path = "/" + os.path.relpath(fs_path, FRONTEND_DIR).replace(os.sep, "/")
+            load_file(path, fs_path)
+
 
 def main():
     os.chdir(FRONTEND_DIR)
+    load_frontend()
 
     handler = partial(CORSHTTPRequestHandler, directory=FRONTEND_DIR)
 
-    with socketserver.TCPServer(("", PORT), handler) as httpd:
+    with http.server.ThreadingHTTPServer(("", PORT), handler) as httpd:
         print(f"\n{'='*50}")
         print(f"  Recipe Calculator Frontend Server")
         print(f"{'='*50}")
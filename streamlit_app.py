@@ -5,7 +5,7 @@ AI-powered ingredient calculator using Google Gemini
 
 import streamlit as st
 import google.generativeai as genai
-import json
+import orjson
 import os
 
 # Page configuration
@@ -39,6 +39,11 @@ st.markdown("""
         margin: 0.5rem 0;
         border-left: 4px solid #667eea;
     }
+    .ingredient-grid {
+        display: grid;
+        grid-template-columns: repeat(2, 1fr);
+        column-gap: 1rem;
+    }
     .nutrition-box {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
         color: white;
@@ -80,6 +85,21 @@ CATEGORY_CONFIG = {
     "other": {"icon": "📦", "color": "#6b7280"},
 }
 
+# Ingredient card template per category, with icon and colors filled in once
+_CATEGORY_HTML = {
+    category: (
+        f'<div class="ingredient-card" style="border-left-color: {config["color"]}">'
+        f'<span style="font-size: 1.5rem">{config["icon"]}</span> '
+        '<strong>{name}</strong><br>'
+        '<span style="font-size: 1.2rem; color: #667eea; font-weight: bold">'
+        '{quantity} {unit}</span>'
+        f'<span style="background: {config["color"]}20; color: {config["color"]}; '
+        'padding: 2px 8px; border-radius: 10px; font-size: 0.8rem; margin-left: 10px">'
+        '{category}</span>{notes}</div>'
+    )
+    for category, config in CATEGORY_CONFIG.items()
+}
+
 # Popular dishes
 POPULAR_DISHES = [
     "Chicken 65", "Biryani", "Butter Chicken", "Pasta Carbonara",
@@ -93,16 +113,10 @@ DIETARY_OPTIONS = [
 ]
 
 
-def get_gemini_response(dish_name: str, servings: int, cuisine_type: str = None, dietary_restrictions: list = None):
-    """Call Gemini API to get recipe ingredients."""
-
-    api_key = os.environ.get("GEMINI_API_KEY") or st.secrets.get("GEMINI_API_KEY")
-
-    if not api_key:
-        st.error("GEMINI_API_KEY not configured. Please add it to your Streamlit secrets.")
-        return None
-
-    genai.configure(api_key=api_key)
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def fetch_recipe(_api_key: str, dish_name: str, servings: int, cuisine_type: str = None, dietary_restrictions: tuple = None):
+    """Call Gemini API to get a recipe; memoized across reruns, so no UI calls here."""
+    genai.configure(api_key=_api_key)
 
     # Build prompt
     extras = ""
@@ -124,28 +138,47 @@ Return JSON only:
 
 Short clear steps. Pro tips. Valid JSON only."""
 
-    try:
-        model = genai.GenerativeModel("gemini-2.0-flash")
-        response = model.generate_content(
-            prompt,
-            generation_config=genai.types.GenerationConfig(
-                temperature=0.4,
-                top_p=0.95,
-                max_output_tokens=4096,
-            )
+    model = genai.GenerativeModel("gemini-2.0-flash")
+    response = model.generate_content(
+        prompt,
+        generation_config=genai.types.GenerationConfig(
+            temperature=0.4,
+            top_p=0.95,
+            max_output_tokens=4096,
         )
+    )
+
+    # Parse response
+    text = response.text.strip()
+    if text.startswith("```"):
+        text = text.split("```")[1]
+        if text.startswith("json"):
+            text = text[4:]
+    text = text.strip()
 
-        # Parse response
-        text = response.text.strip()
-        if text.startswith("```"):
-            text = text.split("```")[1]
-            if text.startswith("json"):
-                text = text[4:]
-        text = text.strip()
+    return orjson.loads(text)
 
-        return json.loads(text)
 
-    except json.JSONDecodeError as e:
+def get_gemini_response(dish_name: str, servings: int, cuisine_type: str = None, dietary_restrictions: list = None):
+    """Get recipe ingredients, reporting configuration and API errors in the UI."""
+
+    api_key = os.environ.get("GEMINI_API_KEY") or st.secrets.get("GEMINI_API_KEY")
+
+    if not api_key:
+        st.error("GEMINI_API_KEY not configured. Please add it to your Streamlit secrets.")
+        return None
+
+    try:
+        # Failed calls raise, so they are not cached and are retried next time
+        return fetch_recipe(
+            api_key,
+            dish_name,
+            servings,
+            cuisine_type,
+            tuple(dietary_restrictions) if dietary_restrictions else None,
+        )
+
+    except orjson.JSONDecodeError as e:
         st.error(f"Failed to parse recipe response: {e}")
         return None
     except Exception as e:
@@ -155,27 +188,23 @@ Short clear steps. Pro tips. Valid JSON only."""
 
 def display_ingredients(ingredients):
     """Display ingredients in a nice format."""
-    cols = st.columns(2)
-
-    for idx, ing in enumerate(ingredients):
+    # Build every card first and render them in one call, not one per ingredient
+    cards = []
+    for ing in ingredients:
         category = ing.get("category", "other").lower()
-        config = CATEGORY_CONFIG.get(category, CATEGORY_CONFIG["other"])
+        notes = f"<br><small style='color: #6b7280'>{ing['notes']}</small>" if ing.get("notes") else ""
+
+        cards.append(
+            _CATEGORY_HTML.get(category, _CATEGORY_HTML["other"]).format(
+                name=ing["name"],
+                quantity=ing["quantity"],
+                unit=ing["unit"],
+                category=category,
+                notes=notes,
+            )
+        )
 
-        with cols[idx % 2]:
-            st.markdown(f"""
-            <div class="ingredient-card" style="border-left-color: {config['color']}">
-                <span style="font-size: 1.5rem">{config['icon']}</span>
-                <strong>{ing['name']}</strong><br>
-                <span style="font-size: 1.2rem; color: #667eea; font-weight: bold">
-                    {ing['quantity']} {ing['unit']}
-                </span>
-                <span style="background: {config['color']}20; color: {config['color']};
-                       padding: 2px 8px; border-radius: 10px; font-size: 0.8rem; margin-left: 10px">
-                    {category}
-                </span>
-                {f"<br><small style='color: #6b7280'>{ing.get('notes', '')}</small>" if ing.get('notes') else ""}
-            </div>
-            """, unsafe_allow_html=True)
+    st.markdown(f'<div class="ingredient-grid">{"".join(cards)}</div>', unsafe_allow_html=True)
 
 
 def display_nutrition(nutrition):
@@ -325,7 +354,7 @@ def main():
         st.divider()
         st.download_button(
             label="📥 Download Recipe (JSON)",
-            data=json.dumps(result, indent=2),
+            data=orjson.dumps(result, option=orjson.OPT_INDENT_2),
             file_name=f"{result.get('dish_name', 'recipe').replace(' ', '_').lower()}_recipe.json",
             mime="application/json"
         )
@@ -0,0 +1,92 @@
+"""Tests for the in-memory cache."""
+
+import asyncio
+import random
+import time
+
+from app.services.cache import CacheService, InMemoryCache, _FrequencySketch
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _force_heap_rebuild_on_next_set(cache: InMemoryCache) -> None:
+    """Leave enough stale heap items behind that the next set() rebuilds the heap."""
+    async def fill():
+        for i in range(100):
+            await cache.set(f"stale{i}", i, ttl=100)
+        for i in range(100):
+            await cache.delete(f"stale{i}")
+
+    _run(fill())
+    assert len(cache._expiry_heap) > 2 * len(cache) + 64
+
+
+def test_new_entry_expires_after_heap_rebuild_on_set():
+    cache = InMemoryCache(max_size=1000)
+    _force_heap_rebuild_on_next_set(cache)
+
+    _run(cache.set("fresh", "value", ttl=0.05))
+    time.sleep(0.1)
+
+    assert _run(cache.size()) == 0
+
+
+def test_reset_entry_expires_after_heap_rebuild_on_set():
+    cache = InMemoryCache(max_size=1000)
+    _run(cache.set("recipe", "old", ttl=100))
+    _force_heap_rebuild_on_next_set(cache)
+
+    _run(cache.set("recipe", "new", ttl=0.05))
+    time.sleep(0.1)
+
+    assert _run(cache.size()) == 0
+
+
+def test_recipe_key_distinguishes_cuisine_type():
+    plain = CacheService.generate_recipe_key("Curry", 4)
+    thai = CacheService.generate_recipe_key("Curry", 4, cuisine_type="Thai")
+    indian = CacheService.generate_recipe_key("Curry", 4, cuisine_type="Indian")
+
+    assert len({plain, thai, indian}) == 3
+    assert thai == CacheService.generate_recipe_key("curry ", 4, cuisine_type=" thai")
+
+
+def test_frequency_sketch_rows_use_distinct_counters():
+    sketch = _FrequencySketch(1000)
+    indexes = [sketch._indexes(f"dish{i}") for i in range(100)]
+
+    # No row maps every key onto the same counter
+    for row in zip(*indexes):
+        assert len(set(row)) > 1
+    assert sketch._indexes("biryani") != sketch._indexes("carbonara")
+
+
+def test_frequency_sketch_counts_keys_independently():
+    sketch = _FrequencySketch(1000)
+    for _ in range(10):
+        sketch.increment("biryani")
+
+    assert sketch.frequency("biryani") == 10
+    assert sketch.frequency("carbonara") == 0
+
+
+def test_small_caches_never_exceed_max_size():
+    rng = random.Random(0)
+
+    async def fuzz(max_size):
+        cache = InMemoryCache(max_size=max_size)
+        for _ in range(2000):
+            key = f"k{rng.randrange(8)}"
+            op = rng.random()
+            if op < 0.5:
+                await cache.get(key)
+            elif op < 0.9:
+                await cache.set(key, key)
+            else:
+                await cache.delete(key)
+            assert len(cache) <= max_size
+
+    for max_size in range(1, 6):
+        _run(fuzz(max_size))
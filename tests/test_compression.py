@@ -0,0 +1,44 @@
+"""Tests for response compression."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, encoded_etag, identity_etag
+from app.core.security import ETagMiddleware
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+
+    @app.get("/api/recipe")
+    async def recipe():
+        return {"cooking_instructions": ["Stir the pot."] * 100}
+
+    app.add_middleware(ETagMiddleware)
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+    return TestClient(app)
+
+
+def test_encoded_etag_round_trips():
+    assert encoded_etag('"abc"', "br") == '"abc-br"'
+    assert identity_etag('"abc-br"') == '"abc"'
+    assert encoded_etag('W/"abc"', "br") == 'W/"abc"'
+
+
+def test_compressed_responses_get_their_own_etag():
+    client = _client()
+
+    identity = client.get("/api/recipe", headers={"Accept-Encoding": "identity"})
+    compressed = client.get("/api/recipe", headers={"Accept-Encoding": "br"})
+
+    assert compressed.headers["content-encoding"] == "br"
+    assert compressed.headers["etag"] == encoded_etag(identity.headers["etag"], "br")
+
+
+def test_compressed_etag_revalidates():
+    client = _client()
+    etag = client.get("/api/recipe", headers={"Accept-Encoding": "br"}).headers["etag"]
+
+    response = client.get("/api/recipe", headers={"Accept-Encoding": "br", "If-None-Match": etag})
+
+    assert response.status_code == 304
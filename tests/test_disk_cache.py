@@ -0,0 +1,84 @@
+"""Tests for the persistent SQLite recipe cache."""
+
+import asyncio
+import sqlite3
+
+from fastapi.testclient import TestClient
+
+from app.config import Settings
+from app.main import create_app
+from app.services.cache import CachedRecipe, DiskCache
+
+
+def _row_count(path) -> int:
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM recipes").fetchone()[0]
+
+
+def test_expired_rows_are_purged_on_open(tmp_path):
+    path = str(tmp_path / "recipes.sqlite3")
+    disk = DiskCache(path)
+    asyncio.run(disk.set("old", CachedRecipe(b"{}"), ttl=1, storage_ttl=-1))
+    asyncio.run(disk.set("live", CachedRecipe(b"{}"), ttl=100, storage_ttl=100))
+    disk.close()
+    assert _row_count(path) == 2
+
+    DiskCache(path).close()
+
+    assert _row_count(path) == 1
+
+
+def test_expired_rows_are_purged_periodically(tmp_path):
+    path = str(tmp_path / "recipes.sqlite3")
+    disk = DiskCache(path)
+
+    async def fill():
+        for i in range(DiskCache.PURGE_EVERY):
+            await disk.set(f"old{i}", CachedRecipe(b"{}"), ttl=1, storage_ttl=-1)
+
+    asyncio.run(fill())
+
+    assert _row_count(path) == 0
+    disk.close()
+
+
+def test_corrupt_row_is_a_miss_and_deleted(tmp_path):
+    path = str(tmp_path / "recipes.sqlite3")
+    disk = DiskCache(path)
+    asyncio.run(disk.set("recipe", CachedRecipe(b'{"dish_name":"Dal"}'), ttl=100, storage_ttl=100))
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE recipes SET value = substr(value, 1, 5)")
+
+    assert asyncio.run(disk.get("recipe")) is None
+    assert _row_count(path) == 0
+    disk.close()
+
+
+def test_undecodable_payload_is_a_miss(tmp_path):
+    path = str(tmp_path / "recipes.sqlite3")
+    disk = DiskCache(path)
+    asyncio.run(disk.set("recipe", CachedRecipe(b'{"dish_name":'), ttl=100, storage_ttl=100))
+
+    assert asyncio.run(disk.get("recipe")) is None
+    assert _row_count(path) == 0
+    disk.close()
+
+
+def _health_status(cache_disk_path: str) -> int:
+    app = create_app(Settings(gemini_api_key="", cache_disk_path=cache_disk_path))
+    with TestClient(app) as client:
+        return client.get("/health").status_code
+
+
+def test_app_runs_without_disk_cache_when_file_is_not_sqlite(tmp_path):
+    path = tmp_path / "cache.db"
+    path.write_bytes(b"not a database" * 100)
+
+    assert _health_status(str(path)) == 200
+
+
+def test_app_runs_without_disk_cache_when_directory_cannot_be_created(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+
+    assert _health_status(str(blocker / "cache.db")) == 200
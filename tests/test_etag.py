@@ -0,0 +1,51 @@
+"""Tests for conditional recipe requests."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.security import ETagMiddleware, SecurityHeadersMiddleware
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+
+    @app.api_route("/api/recipe", methods=["GET", "POST"])
+    async def recipe():
+        return {"dish_name": "Dal"}
+
+    @app.get("/api/cache/stats")
+    async def stats():
+        return {}
+
+    app.add_middleware(ETagMiddleware)
+    app.add_middleware(SecurityHeadersMiddleware)
+    return TestClient(app)
+
+
+def test_recipe_responses_may_be_kept_but_must_be_revalidated():
+    client = _client()
+
+    assert client.post("/api/recipe").headers["cache-control"] == "no-cache"
+    assert "no-store" in client.get("/api/cache/stats").headers["cache-control"]
+
+
+def test_matching_etag_gets_304_on_get():
+    client = _client()
+    etag = client.get("/api/recipe").headers["etag"]
+
+    response = client.get("/api/recipe", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_matching_etag_gets_412_on_post():
+    client = _client()
+    etag = client.post("/api/recipe").headers["etag"]
+
+    matched = client.post("/api/recipe", headers={"If-None-Match": etag})
+    changed = client.post("/api/recipe", headers={"If-None-Match": '"other"'})
+
+    assert matched.status_code == 412
+    assert matched.content == b""
+    assert changed.status_code == 200
@@ -0,0 +1,30 @@
+"""Tests for rate limiting configuration."""
+
+from fastapi.testclient import TestClient
+
+from app.config import Settings
+from app.main import create_app
+
+
+def _recipe_statuses(rate_limit_recipe: str, count: int) -> list:
+    settings = Settings(gemini_api_key="", cache_disk_path="", rate_limit_recipe=rate_limit_recipe)
+    body = {"dish_name": "Dal", "servings": 2}
+    with TestClient(create_app(settings)) as client:
+        return [client.post("/api/recipe", json=body).status_code for _ in range(count)]
+
+
+def test_limits_come_from_settings_passed_to_create_app():
+    assert _recipe_statuses("2/minute", 3) == [503, 503, 429]
+
+
+def test_apps_keep_their_own_limits():
+    strict = Settings(gemini_api_key="", cache_disk_path="", rate_limit_recipe="1/minute")
+    loose = Settings(gemini_api_key="", cache_disk_path="", rate_limit_recipe="3/minute")
+    body = {"dish_name": "Dal", "servings": 2}
+
+    with TestClient(create_app(strict)) as strict_client, TestClient(create_app(loose)) as loose_client:
+        strict_statuses = [strict_client.post("/api/recipe", json=body).status_code for _ in range(2)]
+        loose_statuses = [loose_client.post("/api/recipe", json=body).status_code for _ in range(4)]
+
+    assert strict_statuses == [503, 429]
+    assert loose_statuses == [503, 503, 503, 429]
@@ -0,0 +1,54 @@
+"""Tests for the streaming recipe endpoint."""
+
+import json
+import time
+
+from fastapi.testclient import TestClient
+
+from app.config import Settings
+from app.main import create_app
+from app.services.gemini import GeminiService
+
+RECIPE = {
+    "dish_name": "Dal",
+    "servings": 2,
+    "total_prep_time_minutes": 30,
+    "ingredients": [{"name": "lentils", "quantity": 200, "unit": "grams", "category": "grain"}],
+    "cooking_instructions": ["Boil and stir"],
+}
+
+
+class FakeGemini(GeminiService):
+    """Gemini service streaming a fixed recipe and counting calls."""
+
+    def __init__(self):
+        super().__init__(Settings(gemini_api_key="", cache_disk_path=""))
+        self._configured = True
+        self.calls = 0
+
+    async def stream_recipe(self, request):
+        self.calls += 1
+        text = json.dumps(RECIPE)
+        for i in range(0, len(text), 40):
+            yield text[i : i + 40]
+
+
+def test_stale_recipe_is_streamed_and_refreshed_in_background():
+    app = create_app(Settings(gemini_api_key="", cache_disk_path="", cache_stale_grace_seconds=60))
+    body = {"dish_name": "Dal", "servings": 2}
+
+    with TestClient(app) as client:
+        gemini = app.state.gemini_service = FakeGemini()
+        client.post("/api/recipe/stream", json=body)
+        assert gemini.calls == 1
+        stored = client.portal.call(app.state.cache_service.get_recipe, "Dal", 2)
+        stored.fresh_until = time.monotonic() - 1
+
+        response = client.post("/api/recipe/stream", json=body)
+        deadline = time.monotonic() + 2
+        while gemini.calls < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert response.text.startswith("event: recipe\n")
+    assert response.text.count("event: ") == 1
+    assert gemini.calls == 2